@@ -0,0 +1,111 @@
+import glob
+import json
+import os
+import time
+
+from lxml import etree
+
+from pageParser import parse_directory, parse_html, row_key
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "1xbet")
+# parse_directory is only timed on directories big enough to amortize pool start-up
+PARALLEL_MIN_PAGES = 200
+
+# The bundled fixture is hand-written and only checks the edge cases of the
+# row mapping. For meaningful numbers run this on a directory of real pages
+# archived with scrape_page(url, batched=True, snapshot_dir=...); pages with a
+# reviewed <name>.json next to them are also scored for accuracy.
+
+
+def load_fixtures(directory=FIXTURES_DIR):
+    """Return [(name, html_bytes, expected_rows or None), ...] for every page in directory."""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, "rb") as f:
+            source = f.read()
+        try:
+            parse_html(source)
+        except etree.LxmlError as e:
+            print(f"⚠️ Skipping page {path}: {e}")
+            continue
+        expected = None
+        expected_path = os.path.splitext(path)[0] + ".json"
+        if os.path.exists(expected_path):
+            with open(expected_path, encoding="utf-8") as f:
+                expected = json.load(f)
+        fixtures.append((os.path.basename(path), source, expected))
+    return fixtures
+
+
+def score_rows(parsed, expected):
+    """Field-level accuracy of parsed rows against the expected rows of one page."""
+    parsed_by_key = {row_key(r): r for r in parsed}
+    total = 0
+    correct = 0
+    for exp in expected:
+        got = parsed_by_key.get(row_key(exp), {})
+        for field, value in exp.items():
+            total += 1
+            if got.get(field) == value:
+                correct += 1
+    # rows we produced that should not exist count against accuracy too
+    total += max(0, len(parsed) - len(expected))
+    return correct, total
+
+
+def run_benchmark(directory=FIXTURES_DIR, iterations=200):
+    fixtures = load_fixtures(directory)
+    if not fixtures:
+        print(f"No fixtures found in {directory}")
+        return None
+
+    # accuracy, on pages that have expected rows
+    correct = total = 0
+    for name, source, expected in fixtures:
+        if expected is None:
+            continue
+        c, t = score_rows(parse_html(source), expected)
+        correct += c
+        total += t
+        print(f"{name:<30} {len(expected):>4} rows  accuracy {c / t:.2%}")
+
+    # single process throughput
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for _, source, _ in fixtures:
+            rows += len(parse_html(source))
+    elapsed = time.perf_counter() - started
+
+    stats = {
+        "pages": len(fixtures),
+        "scored_pages": sum(1 for f in fixtures if f[2] is not None),
+        "accuracy": correct / total if total else None,
+        "rows_per_second": rows / elapsed if elapsed else float("inf"),
+        "parallel_rows_per_second": None,
+    }
+
+    # multi process throughput over the directory
+    if len(fixtures) >= PARALLEL_MIN_PAGES:
+        started = time.perf_counter()
+        parsed = parse_directory(directory)
+        parallel_elapsed = time.perf_counter() - started
+        parallel_rows = sum(len(r) for r in parsed.values())
+        stats["parallel_rows_per_second"] = parallel_rows / parallel_elapsed if parallel_elapsed else float("inf")
+
+    print("=" * 60)
+    print(f"Pages: {stats['pages']} ({stats['scored_pages']} scored) | Iterations: {iterations}")
+    if stats["accuracy"] is not None:
+        print(f"Accuracy: {stats['accuracy']:.2%}")
+    print(f"Rows/sec (single process): {stats['rows_per_second']:,.0f}")
+    if stats["parallel_rows_per_second"] is not None:
+        print(f"Rows/sec (parse_directory): {stats['parallel_rows_per_second']:,.0f}")
+    else:
+        print(f"Rows/sec (parse_directory): skipped, needs at least {PARALLEL_MIN_PAGES} pages")
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR)
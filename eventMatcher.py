@@ -0,0 +1,270 @@
+import json
+import os
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+# Scraped team names that were confirmed to map to an API team name
+ALIAS_FILE = "team_aliases.json"
+
+# Words that bookmakers and the API add or drop freely around team names
+NOISE_WORDS = {"team", "esports", "esport", "gaming", "club", "fc", "the"}
+
+NGRAM_SIZE = 3
+# Scores are in [0, 1]; a row joins an event at or above this score
+MATCH_THRESHOLD = 0.75
+# A team's own similarity must reach this before its name is cached as an alias
+ALIAS_THRESHOLD = 0.8
+# Only the best candidates from the index are scored with SequenceMatcher
+MAX_CANDIDATES = 10
+
+
+def normalize_name(name):
+    """Lowercase, strip accents and punctuation, and drop noise words."""
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c)).lower()
+    words = re.sub(r"[^a-z0-9]+", " ", name).split()
+    kept = [w for w in words if w not in NOISE_WORDS]
+    # a name made only of noise words ("Team") is still a name
+    return " ".join(kept or words)
+
+
+def ngrams(text, n=NGRAM_SIZE):
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def similarity(a, b):
+    if a == b:
+        return 1.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+class EventIndex:
+    """Inverted n-gram index over the normalized team names of an event list.
+
+    Built once per event list; candidate lookups only touch the posting lists
+    of the query's n-grams instead of every event.
+    """
+
+    def __init__(self, events, home_key="home", away_key="away"):
+        self.events = [e for e in events if isinstance(e, dict)]
+        self.names = {}  # normalized name -> its n-gram set
+        self.postings = defaultdict(set)  # n-gram -> normalized names
+        self.events_by_name = defaultdict(set)  # normalized name -> event positions
+
+        for pos, event in enumerate(self.events):
+            for key in (home_key, away_key):
+                name = normalize_name(event.get(key))
+                if not name:
+                    continue
+                self.events_by_name[name].add(pos)
+                if name not in self.names:
+                    grams = ngrams(name)
+                    self.names[name] = grams
+                    for gram in grams:
+                        self.postings[gram].add(name)
+
+    def candidates(self, name, limit=MAX_CANDIDATES):
+        """Return up to limit (indexed_name, dice_score) pairs sharing n-grams with name."""
+        if name in self.names:
+            return [(name, 1.0)]
+
+        grams = ngrams(name)
+        shared = Counter()
+        for gram in grams:
+            for indexed in self.postings.get(gram, ()):
+                shared[indexed] += 1
+
+        scored = [(indexed, 2 * count / (len(grams) + len(self.names[indexed])))
+                  for indexed, count in shared.items()]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+
+class EventMatcher:
+    """Join scraped rows (webCrawler.scrape_page) to API events (getSportsOdds)."""
+
+    def __init__(self, events, alias_file=ALIAS_FILE, threshold=MATCH_THRESHOLD,
+                 alias_threshold=ALIAS_THRESHOLD, home_key="home", away_key="away"):
+        self.index = EventIndex(events, home_key, away_key)
+        self.home_key = home_key
+        self.away_key = away_key
+        self.threshold = threshold
+        self.alias_threshold = alias_threshold
+        self.alias_file = alias_file
+        self.aliases = self.load_aliases(alias_file)
+        self._aliases_changed = False
+
+    @staticmethod
+    def load_aliases(alias_file):
+        if not alias_file or not os.path.exists(alias_file):
+            return {}
+        try:
+            with open(alias_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Could not read aliases from {alias_file}: {e}")
+            return {}
+
+    def save_aliases(self):
+        if not self.alias_file or not self._aliases_changed:
+            return
+        with open(self.alias_file, "w", encoding="utf-8") as f:
+            json.dump(self.aliases, f, indent=2, sort_keys=True)
+        self._aliases_changed = False
+
+    def set_alias(self, scraped, canonical):
+        """Add or overwrite the API name a scraped team name resolves to."""
+        self.aliases[normalize_name(scraped)] = normalize_name(canonical)
+        self._aliases_changed = True
+        self.save_aliases()
+
+    def forget_alias(self, scraped):
+        """Drop a cached alias (e.g. a wrong one); returns True when there was one."""
+        if self.aliases.pop(normalize_name(scraped), None) is None:
+            return False
+        self._aliases_changed = True
+        self.save_aliases()
+        return True
+
+    def _resolve(self, name):
+        """
+        Normalized name, translated through the alias cache when known.
+        A name that is itself a team in the current events is never aliased.
+        """
+        name = normalize_name(name)
+        if name in self.index.names:
+            return name
+        return self.aliases.get(name, name)
+
+    def _team_scores(self, name):
+        """{event position: (best similarity, side)} for events with a team like name."""
+        scores = {}
+        for indexed, _ in self.index.candidates(name):
+            sim = similarity(name, indexed)
+            for pos in self.index.events_by_name[indexed]:
+                event = self.index.events[pos]
+                side = "home" if normalize_name(event.get(self.home_key)) == indexed else "away"
+                if pos not in scores or sim > scores[pos][0]:
+                    scores[pos] = (sim, side)
+        return scores
+
+    def match(self, game_info):
+        """Return (event, score, swapped) for the best event, or (None, score, False)."""
+        team1 = self._resolve(game_info.get("team1"))
+        team2 = self._resolve(game_info.get("team2"))
+        if not team1 and not team2:
+            return None, 0.0, False
+
+        scores1 = self._team_scores(team1) if team1 else {}
+        scores2 = self._team_scores(team2) if team2 else {}
+
+        best_pos, best_score, best_swapped = None, 0.0, False
+        for pos in set(scores1) | set(scores2):
+            event = self.index.events[pos]
+            home = normalize_name(event.get(self.home_key))
+            away = normalize_name(event.get(self.away_key))
+            if team1 and team2:
+                straight = (similarity(team1, home) + similarity(team2, away)) / 2
+                swapped = (similarity(team1, away) + similarity(team2, home)) / 2
+            else:
+                # single team row: score it against whichever side it resembles
+                sim, side = (scores1 or scores2)[pos]
+                only_team1 = bool(team1)
+                straight = sim if (side == "home") == only_team1 else 0.0
+                swapped = sim if not straight else 0.0
+            score, is_swapped = (swapped, True) if swapped > straight else (straight, False)
+            if score > best_score:
+                best_pos, best_score, best_swapped = pos, score, is_swapped
+
+        if best_pos is None or best_score < self.threshold:
+            return None, best_score, False
+
+        event = self.index.events[best_pos]
+        self._remember(game_info, event, best_swapped)
+        return event, best_score, best_swapped
+
+    def _remember(self, game_info, event, swapped):
+        """
+        Cache scraped -> API names of a confirmed match so later runs hit them
+        exactly. The match itself only needs the average of both teams to pass,
+        so a team is cached only when both teams reach alias_threshold on their
+        own, and never when one name just extends the other ("vitality" and
+        "vitality bee" are likely different teams).
+        """
+        home = normalize_name(event.get(self.home_key))
+        away = normalize_name(event.get(self.away_key))
+        pairs = [(normalize_name(game_info.get("team1")), away if swapped else home),
+                 (normalize_name(game_info.get("team2")), home if swapped else away)]
+        pairs = [(scraped, canonical) for scraped, canonical in pairs if scraped and canonical]
+        if any(similarity(scraped, canonical) < self.alias_threshold for scraped, canonical in pairs):
+            return
+
+        for scraped, canonical in pairs:
+            if scraped == canonical or self.aliases.get(scraped) == canonical:
+                continue
+            if canonical.startswith(scraped) or canonical.endswith(scraped) \
+                    or scraped.startswith(canonical) or scraped.endswith(canonical):
+                continue
+            self.aliases[scraped] = canonical
+            self._aliases_changed = True
+
+    def join(self, rows):
+        """
+        Join scraped rows with API events.
+        Each result keeps the scraped fields and adds event_id, home, away,
+        league, match_score and swapped (scraped team1 is the API away team).
+        Unmatched rows get event_id None.
+        """
+        joined = []
+        for game_info in rows:
+            if "error" in game_info:
+                continue
+            event, score, swapped = self.match(game_info)
+            result = dict(game_info)
+            result["event_id"] = event.get("id") if event else None
+            result["home"] = event.get(self.home_key) if event else None
+            result["away"] = event.get(self.away_key) if event else None
+            league = event.get("league") if event else None
+            result["league"] = league.get("name") if isinstance(league, dict) else league
+            result["match_score"] = round(score, 3)
+            result["swapped"] = swapped
+            joined.append(result)
+
+        self.save_aliases()
+        return joined
+
+
+def attach_api_odds(joined, odds_results, bookmaker="1xbet"):
+    """Add the API bookmaker markets (from getSportsOdds.fetch_all_odds) next to the scraped odds."""
+    odds_by_id = {o.get("id"): o for o in odds_results or [] if isinstance(o, dict)}
+    for result in joined:
+        odds = odds_by_id.get(result.get("event_id"))
+        bookmakers = odds.get("bookmakers") if odds else None
+        result["api_odds"] = bookmakers.get(bookmaker) if isinstance(bookmakers, dict) else None
+    return joined
+
+
+if __name__ == "__main__":
+    from getSportsOdds import api_key, bookmakers, fetch_all_odds, fetch_events_with_status
+    from webCrawler import esportsUrl, scrape_page
+
+    events = fetch_events_with_status("esports", api_key, "live")
+    rows = scrape_page(esportsUrl, batched=True)
+
+    joined = EventMatcher(events).join(rows)
+    matched = [r for r in joined if r["event_id"] is not None]
+    chunks = [matched[i:i + 10] for i in range(0, len(matched), 10)]
+    attach_api_odds(joined, fetch_all_odds([[{"id": r["event_id"]} for r in c] for c in chunks], api_key, bookmakers))
+
+    print(f"\nMatched {len(matched)} of {len(joined)} scraped rows")
+    for r in joined:
+        print(f"{r['event_id']}: {r['team1']} vs {r['team2']} -> {r['home']} vs {r['away']} "
+              f"({r['match_score']}) scraped={r.get('team1_win')}/{r.get('draw')}/{r.get('team2_win')} "
+              f"api={r.get('api_odds')}")
@@ -0,0 +1,136 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Same selectors as the live scraper, as XPath for lxml
+ROW_XPATH = f"//div[{_has_class('betting-main-dashboard')}]//li[{_has_class('dashboard-champ-body')}]"
+ANY_ROW_XPATH = f"//li[{_has_class('dashboard-champ-body')}]"
+HEADING_XPATH = f".//div[{_has_class('dashboard-champ-name')}]//span[{_has_class('ui-caption')}]"
+GAME_BLOCK_XPATH = f".//div[{_has_class('dashboard-game-block')}]"
+TEAM_XPATH = f".//span[{_has_class('dashboard-game-team-info__name')}]"
+SCORE_XPATH = f".//span[{_has_class('ui-game-scores__num')}]"
+ODDS_XPATH = f".//div[{_has_class('dashboard-markets')}]//span[{_has_class('ui-market__value')}]"
+
+_compiled = {}
+
+
+def _xpath(expr):
+    """Compile an XPath once. lxml is imported here so webCrawler does not need it."""
+    if expr not in _compiled:
+        from lxml import etree
+        _compiled[expr] = etree.XPath(expr)
+    return _compiled[expr]
+
+
+def build_game_info(heading, teams, scores, odds):
+    """Build the game_info dict from the raw text pieces of one row.
+
+    teams is None when the row has no game block.
+    """
+    game_info = {"heading": heading}
+
+    teams = teams or []
+    game_info["team1"] = teams[0] if len(teams) >= 1 else None
+    game_info["team2"] = teams[1] if len(teams) >= 2 else None
+
+    # scores: spans come in pairs team1, team2, team1, team2...
+    game_info["team1_score"] = scores[::2]
+    game_info["team2_score"] = scores[1::2]
+
+    # Map odds to team1_win, draw, team2_win if at least 3 values
+    if len(odds) >= 3:
+        game_info["team1_win"] = odds[0]
+        game_info["draw"] = odds[1]
+        game_info["team2_win"] = odds[2]
+    else:
+        # still include odds list for inspection
+        game_info["odds_list"] = odds
+
+    return game_info
+
+
+def row_key(game_info):
+    """Identity of a row: the same game keeps the same heading and team names."""
+    return game_info.get("heading"), game_info.get("team1"), game_info.get("team2")
+
+
+def _text(el):
+    # collapse whitespace the way the browser's rendered text does
+    return " ".join(el.text_content().split())
+
+
+def parse_row(li):
+    """Parse one li.dashboard-champ-body element; None when it has no heading."""
+    heading = _xpath(HEADING_XPATH)(li)
+    if not heading:
+        return None
+
+    blocks = _xpath(GAME_BLOCK_XPATH)(li)
+    if blocks:
+        teams = [_text(s) for s in _xpath(TEAM_XPATH)(blocks[0])]
+        scores = [_text(s) for s in _xpath(SCORE_XPATH)(blocks[0])]
+    else:
+        teams = None
+        scores = []
+    odds = [t for t in (_text(s) for s in _xpath(ODDS_XPATH)(li)) if t]
+
+    return build_game_info(_text(heading[0]), teams, scores, odds)
+
+
+def parse_html(source):
+    """
+    Parse a saved page (str or bytes) into the same game_info list as scrape_page.
+    Raises lxml.etree.ParserError for an empty document.
+    """
+    from lxml import html
+
+    tree = html.fromstring(source)
+    rows = _xpath(ROW_XPATH)(tree) or _xpath(ANY_ROW_XPATH)(tree)
+    results = []
+    for li in rows:
+        game_info = parse_row(li)
+        if game_info is not None:
+            results.append(game_info)
+    return results
+
+
+def parse_file(path):
+    """Parse one snapshot; an unreadable, empty or truncated file gives []."""
+    from lxml import etree
+
+    try:
+        with open(path, "rb") as f:
+            return parse_html(f.read())
+    except (OSError, etree.LxmlError) as e:
+        print(f"⚠️ Skipping snapshot {path}: {e}")
+        return []
+
+
+def parse_directory(directory, pattern="*.html", max_workers=None):
+    """
+    Parse every snapshot in directory across worker processes.
+    Returns {path: [game_info, ...]} in sorted path order.
+    """
+    paths = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not paths:
+        return {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, len(paths) // ((max_workers or os.cpu_count() or 1) * 4))
+        results = executor.map(parse_file, paths, chunksize=chunksize)
+        return dict(zip(paths, results))
+
+
+if __name__ == "__main__":
+    import sys
+
+    snapshot_dir = sys.argv[1] if len(sys.argv) > 1 else "snapshots"
+    for path, rows in parse_directory(snapshot_dir).items():
+        print(f"\n{path}: {len(rows)} rows")
+        for i, r in enumerate(rows):
+            print(f"{i+1}: {r}")
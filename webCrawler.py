@@ -2,15 +2,201 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import os
 import time
+from datetime import datetime
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 
+from pageParser import build_game_info, row_key
+
 baseUrl = "https://1x-probet.com/en"
 esportsUrl = "https://1x-probet.com/en/live/esports"
 
 # Change to True to run headless
 HEADLESS = False
 
+# Pixels to scroll per chunk while walking the virtualized list in batched mode
+SCROLL_CHUNK = 800
+# Stop scrolling after this many chunks in a row produce no new rows
+MAX_IDLE_CHUNKS = 3
+
+# Shared JS helper: reads one li.dashboard-champ-body into {heading, teams, scores, odds}
+READ_ROW_JS = r"""
+const text = (el) => (el ? (el.innerText || el.textContent || "").replace(/\s+/g, " ").trim() : "");
+const readRow = (li) => {
+    const heading = li.querySelector("div.dashboard-champ-name span.ui-caption");
+    if (!heading) return null;
+    const block = li.querySelector("div.dashboard-game-block");
+    return {
+        heading: text(heading),
+        teams: block ? Array.from(block.querySelectorAll("span.dashboard-game-team-info__name"), text) : null,
+        scores: block ? Array.from(block.querySelectorAll("span.ui-game-scores__num"), text) : [],
+        odds: Array.from(li.querySelectorAll("div.dashboard-markets span.ui-market__value"), text).filter(Boolean),
+    };
+};
+"""
+
+# Collects every rendered row in one call and scrolls the page by one chunk.
+# Each li gets a node id ("uid") on first sight, kept in a WeakMap across calls.
+# Returns {"rows": [{uid, heading, teams, scores, odds}, ...], "atBottom": bool}
+EXTRACT_ROWS_JS = READ_ROW_JS + """
+const step = arguments[0];
+if (!window.__scraperUids) window.__scraperUids = {ids: new WeakMap(), next: 0};
+const uids = window.__scraperUids;
+const container = document.querySelector("div.betting-main-dashboard") || document;
+const rows = [];
+container.querySelectorAll("li.dashboard-champ-body").forEach((li) => {
+    const row = readRow(li);
+    if (!row) return;
+    if (!uids.ids.has(li)) uids.ids.set(li, uids.next++);
+    row.uid = uids.ids.get(li);
+    rows.push(row);
+});
+const before = window.scrollY;
+// instant, so a page with smooth scrolling has already moved when we compare
+window.scrollBy({top: step, behavior: "instant"});
+const atBottom = window.scrollY === before ||
+    window.innerHeight + window.scrollY >= document.body.scrollHeight;
+return {rows: rows, atBottom: atBottom};
+"""
+
+# Live mode: how long one drain call waits in the page for mutations (ms)
+LIVE_WAIT_MS = 1000
+# Live mode: extra time to let a burst of mutations settle into one batch (ms)
+LIVE_DEBOUNCE_MS = 50
+# Live mode: tallest viewport used to keep the whole virtualized list rendered (px)
+LIVE_MAX_VIEWPORT = 20000
+
+# Installs a MutationObserver on the dashboard that only records which rows
+# changed; rows are read lazily when the batch is drained.
+# Every li gets an id when first read ("heading | team1 | team2", with " #n"
+# for duplicates), cached per node so removed rows are reported by that id
+# without reading detached nodes.
+# Returns {"changed": [every current row with its id]} so the caller can
+# re-sync, or null when the dashboard is not there.
+INSTALL_OBSERVER_JS = READ_ROW_JS + """
+const debounceMs = arguments[0];
+const root = document.querySelector("div.betting-main-dashboard");
+if (!root) return null;
+if (window.__scraper) {
+    window.__scraper.observer.disconnect();
+    clearTimeout(window.__scraper.debounce);
+}
+
+const ROW = "li.dashboard-champ-body";
+const state = {root: root, dirty: new Set(), removed: new Set(), notify: null, debounce: null,
+               ids: new WeakMap(), inUse: new Set()};
+const rowOf = (node) => {
+    const el = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+    return el ? el.closest(ROW) : null;
+};
+const rowsIn = (node) => {
+    if (node.nodeType !== Node.ELEMENT_NODE) return [];
+    const rows = Array.from(node.querySelectorAll(ROW));
+    if (node.matches(ROW)) rows.push(node);
+    return rows;
+};
+
+// release a node's id; returns the id, or null when it had none
+state.release = (li) => {
+    const cached = state.ids.get(li);
+    if (!cached) return null;
+    state.ids.delete(li);
+    state.inUse.delete(cached.id);
+    return cached.id;
+};
+// read a connected row and attach its id; a node recycled for another game
+// gives up its old id, which is returned in gone
+state.read = (li, gone) => {
+    const row = readRow(li);
+    if (!row) {
+        const old = state.release(li);
+        if (old !== null) gone.push(old);
+        return null;
+    }
+    const teams = row.teams || [];
+    const base = [row.heading, teams[0] || "", teams[1] || ""].join(" | ");
+    let cached = state.ids.get(li);
+    if (cached && cached.base !== base) {
+        gone.push(state.release(li));
+        cached = null;
+    }
+    if (!cached) {
+        let id = base, n = 1;
+        while (state.inUse.has(id)) id = base + " #" + (++n);
+        cached = {id: id, base: base};
+        state.ids.set(li, cached);
+        state.inUse.add(id);
+    }
+    row.id = cached.id;
+    return row;
+};
+
+state.observer = new MutationObserver((mutations) => {
+    for (const m of mutations) {
+        const row = rowOf(m.target);
+        if (row) state.dirty.add(row);
+        m.addedNodes.forEach((n) => rowsIn(n).forEach((r) => state.dirty.add(r)));
+        m.removedNodes.forEach((n) => rowsIn(n).forEach((r) => state.removed.add(r)));
+    }
+    if (state.notify) {
+        const notify = state.notify;
+        state.notify = null;
+        state.debounce = setTimeout(notify, debounceMs);
+    }
+});
+state.observer.observe(root, {childList: true, subtree: true, characterData: true});
+window.__scraper = state;
+
+const changed = [], gone = [];
+root.querySelectorAll(ROW).forEach((li) => {
+    const row = state.read(li, gone);
+    if (row) changed.push(row);
+});
+return {changed: changed};
+"""
+
+# Async script: resolves as soon as the observer has recorded changes (or
+# after the wait expires) with {"changed": [rows with ids], "removed": [ids]}.
+# Resolves with null when the observer is gone (e.g. the page re-rendered).
+DRAIN_ROWS_JS = """
+const done = arguments[arguments.length - 1];
+const waitMs = arguments[0];
+const state = window.__scraper;
+if (!state || !state.root.isConnected) return done(null);
+
+let finished = false;
+const drain = () => {
+    // a timer from this call can still fire after the call has finished
+    if (finished) return;
+    finished = true;
+    clearTimeout(timer);
+    clearTimeout(state.debounce);
+    if (state.notify === drain) state.notify = null;
+
+    const dirty = state.dirty, removed = state.removed;
+    state.dirty = new Set();
+    state.removed = new Set();
+    const changed = [], gone = [];
+    // release detached rows first so a re-rendered row gets its old id back
+    removed.forEach((li) => {
+        if (li.isConnected) return;
+        const id = state.release(li);
+        if (id !== null) gone.push(id);
+    });
+    dirty.forEach((li) => {
+        if (!li.isConnected) return;
+        const row = state.read(li, gone);
+        if (row) changed.push(row);
+    });
+    done({changed: changed, removed: gone});
+};
+
+const timer = setTimeout(drain, waitMs);
+if (state.dirty.size || state.removed.size) drain();
+else state.notify = drain;
+"""
+
 
 def create_driver(headless=HEADLESS):
     options = webdriver.ChromeOptions()
@@ -46,7 +232,198 @@ def safe_find_elements(parent, by, selector):
         return []
 
 
-def scrape_page(url):
+def keyed_rows(rows):
+    """
+    Build game_info for raw rows from EXTRACT_ROWS_JS and pair each with its key.
+    Rows with teams are keyed by (heading, team1, team2). Rows without a
+    team - e.g. several rows of one championship with no game block - share
+    that tuple, so they are keyed by their li's node id instead.
+    """
+    keyed = []
+    for row in rows:
+        game_info = build_game_info(row["heading"], row["teams"], row["scores"], row["odds"])
+        if game_info["team1"] is None:
+            key = ("uid", row["uid"])
+        else:
+            key = row_key(game_info)
+        keyed.append((key, game_info))
+    return keyed
+
+
+def extract_rows_batched(driver, scroll_chunk=SCROLL_CHUNK, max_idle_chunks=MAX_IDLE_CHUNKS, snapshot_dir=None):
+    """
+    Extract every row with one injected script per scroll chunk instead of
+    several WebDriver calls per element.
+    Scrolls the virtualized list from the top until no new rows show up.
+    With snapshot_dir, the page is saved at every chunk so the archived
+    pages together cover every row that was extracted.
+    """
+    driver.execute_script("window.scrollTo(0, 0);")
+    time.sleep(0.5)
+
+    results = {}
+
+    def read(step):
+        # snapshot before the script runs: it scrolls right after reading
+        if snapshot_dir:
+            save_snapshot(driver, snapshot_dir)
+        return driver.execute_script(EXTRACT_ROWS_JS, step) or {}
+
+    def merge(batch):
+        new_rows = 0
+        for key, game_info in keyed_rows(batch.get("rows", [])):
+            if key not in results:
+                new_rows += 1
+            # later sightings of a row carry fresher odds
+            results[key] = game_info
+        return new_rows
+
+    idle_chunks = 0
+    while idle_chunks < max_idle_chunks:
+        batch = read(scroll_chunk)
+        new_rows = merge(batch)
+        time.sleep(0.25)  # give JS time to render the next chunk
+
+        if batch.get("atBottom"):
+            # rows were read before the scroll, so read the last viewport too
+            merge(read(0))
+            break
+        idle_chunks = 0 if new_rows else idle_chunks + 1
+
+    return list(results.values())
+
+
+def save_snapshot(driver, snapshot_dir):
+    """
+    Save the rendered page so it can be re-parsed offline with pageParser.
+    The list is virtualized, so a snapshot only holds the rows rendered at
+    that moment.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = os.path.join(snapshot_dir, f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(driver.page_source)
+    print(f"Saved snapshot to {path}")
+    return path
+
+
+def print_results(results):
+    # Print extracted values
+    print("Extracted values:")
+    for i, r in enumerate(results):
+        print(f"{i+1}: {r}")
+
+
+def diff_rows(known, batch, full=False):
+    """
+    Apply one batch of live rows to the known rows (keyed by row id) and
+    return the change events: added, updated (with the changed fields) and
+    removed. With full=True the batch lists every current row, and known
+    rows missing from it are removed.
+    """
+    events = []
+    seen = set()
+    for row in batch.get("changed", []):
+        game_info = build_game_info(row["heading"], row["teams"], row["scores"], row["odds"])
+        key = row["id"]
+        seen.add(key)
+        old = known.get(key)
+        if old is None:
+            events.append({"type": "added", "key": key, "game": game_info})
+        elif old != game_info:
+            changes = {field: (old.get(field), game_info.get(field))
+                       for field in set(old) | set(game_info)
+                       if old.get(field) != game_info.get(field)}
+            events.append({"type": "updated", "key": key, "game": game_info, "changes": changes})
+        known[key] = game_info
+
+    removed = [key for key in known if key not in seen] if full else batch.get("removed", [])
+    for key in removed:
+        # a re-rendered row is removed and added back in the same batch
+        if key in seen or key not in known:
+            continue
+        events.append({"type": "removed", "key": key, "game": known.pop(key)})
+
+    return events
+
+
+def expand_viewport(driver, max_height=LIVE_MAX_VIEWPORT):
+    """
+    Grow the viewport to the height of the page so the virtualized list
+    renders (and keeps rendered) all of its rows. Returns the viewport height.
+    """
+    height = driver.execute_script("return window.innerHeight;")
+    for _ in range(5):
+        page_height = driver.execute_script("return document.documentElement.scrollHeight;")
+        if page_height <= height or height >= max_height:
+            break
+        height = min(page_height, max_height)
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride",
+                               {"width": 1920, "height": height, "deviceScaleFactor": 1, "mobile": False})
+        time.sleep(0.5)  # let the list render the newly visible rows
+    driver.execute_script("window.scrollTo(0, 0);")
+    return height
+
+
+def watch_page(url, on_event=print, duration=None, wait_ms=LIVE_WAIT_MS, debounce_ms=LIVE_DEBOUNCE_MS,
+               max_viewport=LIVE_MAX_VIEWPORT):
+    """
+    Live mode: keep the page open and emit incremental change events pushed
+    by a MutationObserver on the dashboard.
+
+    on_event is called with {"type", "key", "game"[, "changes"]} for every
+    added, updated or removed row; key is the row id ("heading | team1 | team2").
+    The first events are "added" for every row on the page. Runs until
+    duration seconds have passed (forever when None) or until interrupted.
+
+    The list is virtualized and only rendered rows can be observed, so the
+    viewport is grown to the page height (up to max_viewport px). Rows below
+    that height are never reported, and a row pushed out of the rendered
+    window by the list growing is reported as removed.
+    """
+    print(f"\nWatching: {url}\n")
+    driver = create_driver()
+    wait = WebDriverWait(driver, 20)
+    driver.get(url)
+    driver.set_script_timeout(wait_ms / 1000 + 10)
+
+    try:
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.betting-main-dashboard")))
+    except TimeoutException:
+        print("Warning: betting-main-dashboard not found quickly; continuing...")
+
+    known = {}
+    try:
+        expand_viewport(driver, max_viewport)
+        deadline = time.time() + duration if duration is not None else None
+        installed = False
+        while deadline is None or time.time() < deadline:
+            if not installed:
+                # (re)install the observer and re-sync with every current row
+                batch = driver.execute_script(INSTALL_OBSERVER_JS, debounce_ms)
+                if batch is None:
+                    time.sleep(1)
+                    continue
+                installed = True
+                events = diff_rows(known, batch, full=True)
+            else:
+                batch = driver.execute_async_script(DRAIN_ROWS_JS, wait_ms)
+                if batch is None:
+                    # observer lost (dashboard re-rendered)
+                    installed = False
+                    continue
+                events = diff_rows(known, batch)
+            for event in events:
+                on_event(event)
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        driver.quit()
+
+    return list(known.values())
+
+
+def scrape_page(url, batched=False, snapshot_dir=None):
     print(f"\nGetting data from: {url}\n")
     driver = create_driver()
     wait = WebDriverWait(driver, 20)
@@ -65,6 +442,17 @@ def scrape_page(url):
     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
     time.sleep(2)
 
+    if batched:
+        results = extract_rows_batched(driver, snapshot_dir=snapshot_dir)
+        print(f"Total rows extracted: {len(results)}")
+        driver.quit()
+        print_results(results)
+        return results
+
+    if snapshot_dir:
+        # one snapshot of the rows rendered now; use batched=True to archive every chunk
+        save_snapshot(driver, snapshot_dir)
+
     results = []
 
     # Try to locate the main container (fallback to whole page)
@@ -78,7 +466,6 @@ def scrape_page(url):
     print(f"Total LI items found: {len(li_items)}")
 
     for idx, li in enumerate(li_items):
-        game_info = {}
         try:
             # Scroll this LI into view (virtualized lists require this)
             driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'nearest'});", li)
@@ -86,79 +473,36 @@ def scrape_page(url):
 
             # 1) heading: div.dashboard-champ-name span.ui-caption
             try:
-                heading_elem = li.find_element(By.CSS_SELECTOR, "div.dashboard-champ-name span.ui-caption")
-                game_info["heading"] = heading_elem.text.strip()
+                heading = li.find_element(By.CSS_SELECTOR, "div.dashboard-champ-name span.ui-caption").text.strip()
             except NoSuchElementException:
                 continue
 
             # 2) game block: teams and scores
             try:
                 game_block = li.find_element(By.CSS_SELECTOR, "div.dashboard-game-block")
-                team_name_spans = safe_find_elements(game_block, By.CSS_SELECTOR, "span.dashboard-game-team-info__name")
-                score_spans = safe_find_elements(game_block, By.CSS_SELECTOR, "span.ui-game-scores__num")
-
-                # teams
-                if len(team_name_spans) >= 2:
-                    game_info["team1"] = team_name_spans[0].text.strip()
-                    game_info["team2"] = team_name_spans[1].text.strip()
-                elif len(team_name_spans) == 1:
-                    game_info["team1"] = team_name_spans[0].text.strip()
-                    game_info["team2"] = None
-                else:
-                    game_info["team1"] = None
-                    game_info["team2"] = None
-
-                # scores: spans come in pairs team1, team2, team1, team2...
-                if score_spans:
-                    scores = [s.text.strip() for s in score_spans]
-                    team1_score = scores[::2]
-                    team2_score = scores[1::2]
-                    game_info["team1_score"] = team1_score
-                    game_info["team2_score"] = team2_score
-                else:
-                    game_info["team1_score"] = []
-                    game_info["team2_score"] = []
+                teams = [s.text.strip() for s in
+                         safe_find_elements(game_block, By.CSS_SELECTOR, "span.dashboard-game-team-info__name")]
+                scores = [s.text.strip() for s in
+                          safe_find_elements(game_block, By.CSS_SELECTOR, "span.ui-game-scores__num")]
             except NoSuchElementException:
                 # no game block
-                game_info["team1"] = None
-                game_info["team2"] = None
-                game_info["team1_score"] = []
-                game_info["team2_score"] = []
+                teams = None
+                scores = []
 
             # 3) odds inside div.dashboard-markets -> span.ui-market__value
-            # First wait for dashboard-markets presence inside this li (some rows may not have it)
             odds = []
             try:
-                # Use li.find_elements to search within this li subtree
-                markets_divs = li.find_elements(By.CSS_SELECTOR, "div.dashboard-markets")
-                if not markets_divs:
-                    # optionally wait for ANY markets to appear globally (non-blocking)
-                    # wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.dashboard-markets")))
-                    pass
-
-                for mdiv in markets_divs:
-                    # collect ui-market__value spans inside this markets div
-                    market_spans = safe_find_elements(mdiv, By.CSS_SELECTOR, "span.ui-market__value")
-                    for s in market_spans:
+                for mdiv in li.find_elements(By.CSS_SELECTOR, "div.dashboard-markets"):
+                    for s in safe_find_elements(mdiv, By.CSS_SELECTOR, "span.ui-market__value"):
                         text = s.text.strip()
                         if text:
                             odds.append(text)
+            except Exception:
+                # robust fallback: keep the odds read so far
+                pass
 
-                # Map odds to team1_win, draw, team2_win if at least 3 values
-                if len(odds) >= 3:
-                    # in your original code you assumed [0]=team1, [1]=draw, [2]=team2
-                    game_info["team1_win"] = odds[0]
-                    game_info["draw"] = odds[1]
-                    game_info["team2_win"] = odds[2]
-                else:
-                    # still include odds list for inspection
-                    game_info["odds_list"] = odds
-
-            except Exception as e:
-                # robust fallback
-                game_info["odds_list"] = odds
-                # optional: print(e)
-
+            # same row mapping as the batched, live and offline parsers
+            game_info = build_game_info(heading, teams, scores, odds)
             results.append(game_info)
 
         except StaleElementReferenceException:
@@ -171,14 +515,11 @@ def scrape_page(url):
             results.append({"error": str(e)})
 
     driver.quit()
-
-    # Print extracted values
-    print("Extracted values:")
-    for i, r in enumerate(results):
-        print(f"{i+1}: {r}")
-
+    print_results(results)
     return results
 
 
 if __name__ == "__main__":
     scrape_page(esportsUrl)
+    # Live mode: stream row changes instead of a one-off snapshot
+    # watch_page(esportsUrl)